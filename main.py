@@ -1,17 +1,12 @@
 import time
 import threading
 import os
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
-from dotenv import load_dotenv
-
-# Ensure src directory is in path for module imports
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
-
 from src.logger_setup import get_logger
 from src.audio_recorder import AudioRecorder
-from src.transcriber import OpenAITranscriber
-from src.clipboard_handler import copy_to_clipboard
+from src.transcriber import OpenAITranscriber, get_transcriber
+from src.clipboard_handler import copy_to_clipboard_async
 from src.gui import TranscriptionGUI, STATUS_IDLE, STATUS_RECORDING, STATUS_TRANSCRIBING, STATUS_ERROR
 from src.hotkey_manager import HotkeyManager
 
@@ -29,13 +24,18 @@ class TranscriptionApp:
         # Pass the toggle method to the GUI
         self.gui = TranscriptionGUI(button_callback=self.toggle_recording_state)
         self.recorder = AudioRecorder() # Uses default ../recordings
-        self.transcriber = OpenAITranscriber() # Loads .env internally
+        self.transcriber = get_transcriber() # Shared singleton; loads .env once
         self.hotkey_manager = HotkeyManager(hotkey_str="ctrl+shift+r") # Default hotkey
 
         self.current_state = AppState.IDLE
+        # Guards state transitions: current_state is read and written from
+        # the GUI, hotkey and transcription threads.
+        self._state_lock = threading.Lock()
         self.recording_start_time = None
         self.recording_filepath = None
-        self.audio_capture_active = False # To control the audio capture loop explicitly
+        # Reused worker pool for transcription jobs: avoids per-call thread
+        # startup and lets the transcriber reuse its HTTP connection.
+        self._transcribe_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="transcribe")
 
         self._setup_callbacks()
         self._update_reference_status()
@@ -48,109 +48,88 @@ class TranscriptionApp:
         self.gui.set_file_transcribe_callback(self.transcribe_file)
 
     def _update_gui_status(self, status_text, color="white"):
-        self.gui.gui_queue.put(("update_status", {"text": status_text, "color": color}))
-
-    def _update_gui_timer(self, time_str):
-        self.gui.gui_queue.put(("update_timer", time_str))
+        self.gui.post(("update_status", status_text, color))
 
     def _update_gui_transcript(self, text):
-        self.gui.gui_queue.put(("update_transcript", text))
+        self.gui.post(("update_transcript", text))
 
     def _set_gui_button_states(self, record_enabled):
-        self.gui.gui_queue.put(("set_button_states", {"record_enabled": record_enabled}))
+        self.gui.post(("set_button_states", record_enabled))
 
     def _show_gui_status_message(self, text, duration=3000):
-        self.gui.gui_queue.put(("show_status_message", {"text": text, "duration": duration}))
+        self.gui.post(("show_status_message", text, duration))
 
     def _update_reference_status(self):
         """Update the reference file status in the GUI"""
         status_text, color = self.transcriber.get_reference_status()
-        self.gui.gui_queue.put(("update_reference_status", {"text": status_text, "color": color}))
-
-    def _timer_thread_func(self):
-        logger.debug("Timer thread started.")
-        while self.current_state == AppState.RECORDING and self.recording_start_time:
-            elapsed_seconds = int(time.time() - self.recording_start_time)
-            timer_str = time.strftime('%H:%M:%S', time.gmtime(elapsed_seconds))
-            self._update_gui_timer(timer_str)
-            time.sleep(1) # Update timer every second
-            if not (self.current_state == AppState.RECORDING): # Re-check state after sleep
-                break
-        logger.debug("Timer thread finished.")
-
-    def _audio_capture_loop(self):
-        logger.debug("Audio capture loop started.")
-        try:
-            while self.audio_capture_active: # Controlled by self.audio_capture_active
-                if self.current_state == AppState.RECORDING and self.recorder.is_recording:
-                    self.recorder.record_audio_chunk()
-                    time.sleep(0.01) # Keep this short to quickly fill buffer
-                else:
-                    # If not recording or recorder stopped, exit loop
-                    logger.debug("Audio capture loop condition false, exiting.")
-                    break
-        except Exception as e:
-            logger.error(f"Exception in audio capture loop: {e}", exc_info=True)
-        finally:
-            logger.debug("Audio capture loop finished.")
+        self.gui.post(("update_reference_status", status_text, color))
+
+    def _transition_state(self, expected, desired):
+        """Atomically move current_state from expected to desired.
+
+        Returns True on success, False if another thread changed the state
+        first — closing the check-then-act race between concurrent hotkey
+        and button presses.
+        """
+        with self._state_lock:
+            if self.current_state != expected:
+                return False
+            self.current_state = desired
+            return True
 
+    def _set_state(self, state):
+        with self._state_lock:
+            self.current_state = state
 
     def start_recording(self):
-        if self.current_state != AppState.IDLE:
+        if not self._transition_state(AppState.IDLE, AppState.PROCESSING):
             logger.warning(f"Cannot start recording: Current state is {self.current_state.name}, not IDLE.")
             return
 
         logger.info("Attempting to start recording...")
-        self.current_state = AppState.PROCESSING # Short transition state
 
         self._update_gui_transcript("") # Clear previous transcript
 
         if self.recorder.start_recording():
-            self.current_state = AppState.RECORDING
+            self._set_state(AppState.RECORDING)
             self.recording_start_time = time.time()
             self._update_gui_status(STATUS_RECORDING, "red")
             self._set_gui_button_states(record_enabled=True)
             self._show_gui_status_message("Recording started...")
 
-            threading.Thread(target=self._timer_thread_func, daemon=True).start()
-
-            self.audio_capture_active = True # Enable the capture loop
-            threading.Thread(target=self._audio_capture_loop, daemon=True).start()
+            # Timer updates are driven by the GUI's own queue worker; no dedicated thread.
+            self.gui.post(("start_timer",)) # GUI stamps its own monotonic start
+            # Audio capture happens on PortAudio's callback thread; no Python capture loop needed.
             logger.info("Recording started successfully.")
         else:
-            self.current_state = AppState.IDLE # Revert to IDLE
+            self._set_state(AppState.IDLE) # Revert to IDLE
             self._update_gui_status(STATUS_ERROR + ": Mic?", "orange")
             self._show_gui_status_message("Failed to start recording. Check microphone.", duration=5000)
             self._set_gui_button_states(record_enabled=True) # Ensure button is reset
             logger.error("Failed to start recording (recorder.start_recording returned False).")
 
     def stop_recording_and_process(self):
-        if self.current_state != AppState.RECORDING:
+        if not self._transition_state(AppState.RECORDING, AppState.PROCESSING):
             logger.warning(f"Cannot stop recording: Current state is {self.current_state.name}, not RECORDING.")
             return
 
         logger.info("Attempting to stop recording...")
-        self.current_state = AppState.PROCESSING
-        self.audio_capture_active = False # Signal audio capture loop to stop
-
-        # Wait a very brief moment for the audio capture loop to finish processing its current chunk
-        time.sleep(0.1)
 
         self.recording_filepath = self.recorder.stop_recording() # This also saves the file
 
         self._update_gui_status(STATUS_TRANSCRIBING, "yellow")
         self._set_gui_button_states(record_enabled=False) # Disable button during processing
-        self._update_gui_timer("00:00:00") # Reset timer display
+        self.gui.post(("stop_timer",)) # Stops ticking and resets the display
         self._show_gui_status_message("Recording stopped. Transcribing...")
 
         if self.recording_filepath and os.path.exists(self.recording_filepath):
             logger.info(f"Recording saved to: {self.recording_filepath}")
-            threading.Thread(target=self._transcribe_and_update, args=(self.recording_filepath,), daemon=True).start()
+            self._transcribe_executor.submit(self._transcribe_and_update, self.recording_filepath)
         else:
             logger.error(f"Failed to save recording or file not found. Path: {self.recording_filepath}")
             self._update_gui_status(STATUS_ERROR + ": Save Fail", "red")
             self._show_gui_status_message("Error saving/finding recording file.", duration=5000)
-            self.current_state = AppState.IDLE # Revert to IDLE
+            self._set_state(AppState.IDLE) # Revert to IDLE
             self._set_gui_button_states(record_enabled=True)
 
 
@@ -172,10 +151,7 @@ class TranscriptionApp:
         elif transcript is not None:
             logger.info("Transcription successful.")
             self._update_gui_transcript(transcript)
-            if copy_to_clipboard(transcript):
-                self._show_gui_status_message("Transcript copied to clipboard.")
-            else:
-                self._show_gui_status_message("Transcript ready (clipboard copy failed).", duration=4000)
+            copy_to_clipboard_async(transcript, on_done=self._on_clipboard_copy_done)
             self._update_gui_status(STATUS_IDLE, "white")
         else:
             logger.error("Transcription returned no transcript and no error message.")
@@ -191,7 +167,7 @@ class TranscriptionApp:
         #     except OSError as e:
         #         logger.error(f"Error deleting recording file {audio_path}: {e}")
 
-        self.current_state = AppState.IDLE
+        self._set_state(AppState.IDLE)
         self._set_gui_button_states(record_enabled=True)
         logger.info("Processing finished. App back to IDLE state.")
 
@@ -207,11 +183,11 @@ class TranscriptionApp:
         
         # Update UI to show processing state
         self._show_gui_status_message("Processing file...")
-        self.gui.gui_queue.put(("set_file_button_states", {"transcribe_enabled": False}))
-        self.gui.gui_queue.put(("update_file_transcript", "Processing..."))
+        self.gui.post(("set_file_button_states", False))
+        self.gui.post(("update_file_transcript", "Processing..."))
         
-        # Start transcription in a separate thread to avoid blocking the UI
-        threading.Thread(target=self._transcribe_file_worker, args=(file_path, output_dir), daemon=True).start()
+        # Run transcription on the worker pool to avoid blocking the UI
+        self._transcribe_executor.submit(self._transcribe_file_worker, file_path, output_dir)
     
     def _transcribe_file_worker(self, file_path, output_dir):
         """
@@ -268,7 +244,7 @@ class TranscriptionApp:
                 self._save_transcript_to_file(transcript, file_path, output_dir)
                 
                 # Update UI with the transcript
-                self.gui.gui_queue.put(("update_file_transcript", transcript))
+                self.gui.post(("update_file_transcript", transcript))
                 self._show_gui_status_message("File transcription completed successfully!")
                 
             else:
@@ -287,7 +263,7 @@ class TranscriptionApp:
                     audio_processor.cleanup_temp_file(temp_file)
             
             # Re-enable the transcribe button
-            self.gui.gui_queue.put(("set_file_button_states", {"transcribe_enabled": True}))
+            self.gui.post(("set_file_button_states", True))
             logger.info("File transcription process finished.")
     
     def _save_transcript_to_file(self, transcript, original_file_path, output_dir):
@@ -319,6 +295,13 @@ class TranscriptionApp:
             logger.error(f"Failed to save transcript to file: {e}", exc_info=True)
             self._show_gui_status_message(f"Warning: Failed to save transcript file: {str(e)}")
     
+    def _on_clipboard_copy_done(self, success):
+        """Called from the clipboard worker thread with the copy result."""
+        if success:
+            self._show_gui_status_message("Transcript copied to clipboard.")
+        else:
+            self._show_gui_status_message("Transcript ready (clipboard copy failed).", duration=4000)
+
     def _update_file_transcription_error(self, error_message):
         """
         Update the UI with file transcription error information.
@@ -326,7 +309,7 @@ class TranscriptionApp:
         Args:
             error_message: The error message to display
         """
-        self.gui.gui_queue.put(("update_file_transcript", f"Error: {error_message}"))
+        self.gui.post(("update_file_transcript", f"Error: {error_message}"))
         self._show_gui_status_message(error_message, duration=5000)
 
 
@@ -347,7 +330,7 @@ class TranscriptionApp:
         if not self.hotkey_manager.start_listening():
             # Log and show message in GUI status bar, but continue running
             logger.error("CRITICAL: Hotkey listener failed to start. Hotkeys will not function. Check logs for errors (e.g., Linux permissions).")
-            self.gui.gui_queue.put(("show_status_message", {"text": "ERROR: Hotkeys disabled! Check logs.", "duration": 10000}))
+            self.gui.post(("show_status_message", "ERROR: Hotkeys disabled! Check logs.", 10000))
             # You might want to show a popup here too, but the status bar message is a start.
 
         try:
@@ -362,7 +345,6 @@ class TranscriptionApp:
             # If recording was active, ensure it's stopped and threads are signaled
             if self.current_state == AppState.RECORDING:
                 logger.warning("Application shutting down during recording. Attempting to stop.")
-                self.audio_capture_active = False # Stop capture loop
                 # Note: stop_recording() saves the file. If mid-transcription, that's harder to handle gracefully here.
                 # For now, just ensure recording resources are freed.
                 if self.recorder and self.recorder.is_recording:
@@ -372,13 +354,17 @@ class TranscriptionApp:
                 if self.recorder and self.recorder.is_recording:
                     self.recorder.stop_recording()
 
+            if self.recorder:
+                self.recorder.close() # Release the long-lived PyAudio instance
+
+            self._transcribe_executor.shutdown(wait=False)
+
             logger.info("Shutdown complete.")
 
 
 if __name__ == "__main__":
-    load_dotenv() # Load .env variables for the check below
-    api_key = os.getenv("OPENAI_API_KEY")
-    model_name = os.getenv("MODEL_NAME")
+    # Loads .env exactly once; OpenAITranscriber reuses the memoized result.
+    api_key, model_name = OpenAITranscriber.check_config()
 
     if not api_key or api_key == "YOUR_OPENAI_API_KEY_HERE":
         warning_message = "OPENAI_API_KEY is not set or is a placeholder in .env. Transcription will fail."
@@ -387,8 +373,8 @@ if __name__ == "__main__":
         print(f"WARNING: {warning_message}")
         print("The application will start but transcription will fail without a valid API key.")
 
-    if not model_name:
-        logger.warning("MODEL_NAME not found in .env, will default to 'gpt-4o' in OpenAITranscriber.")
+    if not os.getenv("MODEL_NAME"):
+        logger.warning(f"MODEL_NAME not found in .env, defaulting to '{model_name}'.")
 
 
     app = TranscriptionApp()
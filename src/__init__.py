@@ -0,0 +1 @@
+# Package marker so `from src.X import Y` resolves without sys.path tricks.
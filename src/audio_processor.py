@@ -1,16 +1,18 @@
 import os
+import subprocess
 import tempfile
-from pydub import AudioSegment
+import wave
 from .logger_setup import get_logger
 
 logger = get_logger(__name__)
 
 class AudioProcessor:
-    def __init__(self):
-        # Supported audio and video extensions
-        self.supported_audio_formats = ['.wav', '.mp3', '.m4a', '.aac', '.flac', '.ogg']
-        self.supported_video_formats = ['.mp4', '.avi', '.mov', '.mkv', '.webm']
-    
+    # Supported audio and video extensions; frozensets give O(1) membership
+    # tests and one canonical definition shared by all instances.
+    _AUDIO_EXTS = frozenset({'.wav', '.mp3', '.m4a', '.aac', '.flac', '.ogg'})
+    _VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.webm'})
+
+
     def convert_to_x2_speed(self, input_path: str) -> str:
         """
         Convert audio file to 2x speed and return path to the new file.
@@ -23,27 +25,26 @@ class AudioProcessor:
         """
         try:
             logger.info(f"Converting audio to 2x speed: {input_path}")
-            
-            # Load the audio file
-            audio = AudioSegment.from_wav(input_path)
-            
-            # Speed up by 2x (this reduces duration by half)
-            # speedup_audio changes playback speed without changing pitch
-            sped_up_audio = audio.speedup(playback_speed=2.0)
-            
+
             # Create temporary file for the sped-up version
             temp_dir = os.path.dirname(input_path)
             temp_filename = f"x2_{os.path.basename(input_path)}"
             output_path = os.path.join(temp_dir, temp_filename)
-            
-            # Export the sped-up audio
-            sped_up_audio.export(output_path, format="wav")
-            
+
+            # Use ffmpeg's atempo filter directly (ffmpeg is already required
+            # by pydub); its C implementation is far faster than pydub's
+            # pure-Python speedup for the same pitch-preserving result.
+            subprocess.run(
+                ["ffmpeg", "-y", "-i", input_path,
+                 "-filter:a", "atempo=2.0", "-ac", "1", "-ar", "16000",
+                 output_path],
+                check=True, stderr=subprocess.DEVNULL
+            )
+
             logger.info(f"Successfully converted to 2x speed: {output_path}")
-            logger.debug(f"Original duration: {len(audio)}ms, New duration: {len(sped_up_audio)}ms")
-            
+
             return output_path
-            
+
         except Exception as e:
             logger.error(f"Failed to convert audio to 2x speed: {e}", exc_info=True)
             # Return original path if conversion fails
@@ -60,7 +61,7 @@ class AudioProcessor:
             True if the file format is supported, False otherwise
         """
         file_ext = os.path.splitext(file_path)[1].lower()
-        return file_ext in (self.supported_audio_formats + self.supported_video_formats)
+        return file_ext in self._AUDIO_EXTS or file_ext in self._VIDEO_EXTS
     
     def is_video_file(self, file_path: str) -> bool:
         """
@@ -73,7 +74,7 @@ class AudioProcessor:
             True if the file is a video file, False otherwise
         """
         file_ext = os.path.splitext(file_path)[1].lower()
-        return file_ext in self.supported_video_formats
+        return file_ext in self._VIDEO_EXTS
     
     def extract_audio_from_video(self, video_path: str) -> str:
         """
@@ -87,61 +88,79 @@ class AudioProcessor:
         """
         try:
             logger.info(f"Extracting audio from video: {video_path}")
-            
-            # Load the video file
-            audio = AudioSegment.from_file(video_path)
-            
+
             # Create output path for extracted audio
             video_dir = os.path.dirname(video_path)
             video_name = os.path.splitext(os.path.basename(video_path))[0]
             output_path = os.path.join(video_dir, f"extracted_{video_name}.wav")
-            
-            # Export as WAV
-            audio.export(output_path, format="wav")
-            
+
+            # Let ffmpeg demux and encode disk-to-disk; going through pydub
+            # would hold the whole uncompressed PCM stream in Python memory.
+            subprocess.run(
+                ["ffmpeg", "-y", "-i", video_path,
+                 "-vn", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
+                 output_path],
+                check=True, stderr=subprocess.DEVNULL
+            )
+
             logger.info(f"Successfully extracted audio to: {output_path}")
-            logger.debug(f"Audio duration: {len(audio)}ms")
-            
+
             return output_path
-            
+
         except Exception as e:
             logger.error(f"Failed to extract audio from video: {e}", exc_info=True)
             raise
     
+    def _is_target_wav(self, path: str) -> bool:
+        """
+        Cheaply check whether a WAV file is already 16 kHz mono PCM16,
+        i.e. the exact shape the transcriber expects.
+        """
+        try:
+            with wave.open(path, 'rb') as w:
+                return (w.getnchannels() == 1
+                        and w.getframerate() == 16000
+                        and w.getsampwidth() == 2)
+        except (wave.Error, OSError):
+            return False
+
     def convert_to_wav(self, input_path: str) -> str:
         """
         Convert audio file to WAV format for transcription.
-        
+
         Args:
             input_path: Path to the input audio/video file
-            
+
         Returns:
             Path to the converted WAV file
         """
         try:
-            # If it's already a WAV file, return as-is
-            if input_path.lower().endswith('.wav'):
-                logger.info(f"File is already in WAV format: {input_path}")
+            # If the file is already a 16 kHz mono PCM16 WAV, skip the
+            # round-trip entirely (only a header read is needed to tell).
+            if input_path.lower().endswith('.wav') and self._is_target_wav(input_path):
+                logger.info(f"File is already in target WAV format: {input_path}")
                 return input_path
-            
+
             logger.info(f"Converting file to WAV format: {input_path}")
-            
-            # Load the audio/video file
-            audio = AudioSegment.from_file(input_path)
-            
+
             # Create output path
             file_dir = os.path.dirname(input_path)
             file_name = os.path.splitext(os.path.basename(input_path))[0]
             output_path = os.path.join(file_dir, f"converted_{file_name}.wav")
-            
-            # Export as WAV
-            audio.export(output_path, format="wav")
-            
+
+            # Let ffmpeg stream disk-to-disk rather than round-tripping the
+            # whole file through an in-memory AudioSegment.
+            subprocess.run(
+                ["ffmpeg", "-y", "-i", input_path,
+                 "-c:a", "pcm_s16le", "-ac", "1", "-ar", "16000",
+                 output_path],
+                check=True, stderr=subprocess.DEVNULL
+            )
+
             logger.info(f"Successfully converted to WAV: {output_path}")
-            logger.debug(f"Audio duration: {len(audio)}ms")
-            
+
             return output_path
-            
+
         except Exception as e:
             logger.error(f"Failed to convert file to WAV: {e}", exc_info=True)
             raise
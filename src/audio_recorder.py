@@ -3,14 +3,8 @@ import wave
 import os
 import time
 from datetime import datetime
-import sys # Added for path adjustment
 
-# Adjust path for direct execution
-if __name__ == '__main__' and __package__ is None:
-    sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-    from src.logger_setup import get_logger
-else:
-    from .logger_setup import get_logger
+from .logger_setup import get_logger
 
 
 logger = get_logger(__name__)
@@ -21,21 +15,36 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 class AudioRecorder:
     def __init__(self, output_folder_name="recordings"):
         self.output_folder = os.path.join(PROJECT_ROOT, output_folder_name)
-        if not os.path.exists(self.output_folder):
-            os.makedirs(self.output_folder)
-            logger.info(f"Created output folder: {self.output_folder}")
+        # Single syscall, no exists/makedirs race window
+        os.makedirs(self.output_folder, exist_ok=True)
 
-        self.chunk = 1024  # Record in chunks of 1024 samples
+        self.chunk = 4096  # 256 ms buffers: quarters the callback rate vs 1024; latency is irrelevant for an upload-at-end pipeline
         self.sample_format = pyaudio.paInt16  # 16 bits per sample
         self.channels = 1  # Mono
         self.fs = 16000  # Record at 16000 samples per second
 
-        self.p = None
+        # One PyAudio instance for the app lifetime: PortAudio init/teardown
+        # enumerates every host device and can take hundreds of ms.
+        self.p = pyaudio.PyAudio()
+        self._sample_width = self.p.get_sample_size(self.sample_format)
         self.stream = None
-        self.frames = []
+        self._wf = None  # wave writer, open for the duration of a recording
         self.is_recording = False
         self.filename = None
 
+    def _pa_callback(self, in_data, frame_count, time_info, status):
+        """PortAudio callback: runs on PortAudio's internal thread.
+
+        Streams the chunk straight to the open wave file, so RAM usage
+        stays O(1) regardless of recording length and there is no
+        buffer-flush stall at stop time.
+        """
+        if self._wf:
+            # raw variant skips the seek-back header patch wave does on
+            # every writeframes; close() finalizes the header once instead.
+            self._wf.writeframesraw(in_data)
+        return (None, pyaudio.paContinue)
+
     def _generate_filename(self):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         return os.path.join(self.output_folder, f"recording_{timestamp}.wav")
@@ -45,24 +54,35 @@ class AudioRecorder:
             logger.warning("Recording is already in progress.")
             return False
 
-        self.p = pyaudio.PyAudio()
+        # Open the wave writer before the stream so the callback can start
+        # writing as soon as PortAudio delivers the first chunk.
+        self.filename = self._generate_filename()
+        self._wf = wave.open(self.filename, 'wb')
+        self._wf.setnchannels(self.channels)
+        self._wf.setsampwidth(self._sample_width)
+        self._wf.setframerate(self.fs)
+
         try:
             self.stream = self.p.open(format=self.sample_format,
                                       channels=self.channels,
                                       rate=self.fs,
                                       frames_per_buffer=self.chunk,
-                                      input=True)
+                                      input=True,
+                                      stream_callback=self._pa_callback)
         except Exception as e:
             logger.error(f"Failed to open audio stream: {e}")
             if "Invalid input device" in str(e) or "No Default Input Device Available" in str(e):
                 logger.error("No input device found. Please check your microphone connection and system settings.")
-            self.p.terminate()
-            self.p = None
+            self._wf.close()
+            self._wf = None
+            try:
+                os.remove(self.filename)
+            except OSError:
+                pass
+            self.filename = None
             return False
 
-        self.frames = []
         self.is_recording = True
-        self.filename = self._generate_filename()
         logger.info(f"Recording started. Saving to {self.filename}")
         return True
 
@@ -75,38 +95,24 @@ class AudioRecorder:
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
-        if self.p:
-            self.p.terminate()
-            self.p = None # Reset PyAudio instance
+            self.stream = None
 
         logger.info("Recording stopped.")
 
-        self._save_recording()
+        if self._wf:
+            self._wf.close() # Finalizes the RIFF header
+            self._wf = None
+            logger.info(f"Recording saved to {self.filename}")
         return self.filename
 
-    def _save_recording(self):
-        if not self.frames:
-            logger.warning("No frames recorded to save.")
-            return
-
-        wf = wave.open(self.filename, 'wb')
-        wf.setnchannels(self.channels)
-        wf.setsampwidth(self.p.get_sample_size(self.sample_format) if self.p else pyaudio.PyAudio().get_sample_size(self.sample_format)) # Use a temporary instance if self.p is None
-        wf.setframerate(self.fs)
-        wf.writeframes(b''.join(self.frames))
-        wf.close()
-        logger.info(f"Recording saved to {self.filename}")
-
-    def record_audio_chunk(self):
-        """Call this method repeatedly in a loop while is_recording is true."""
-        if self.is_recording and self.stream:
-            try:
-                data = self.stream.read(self.chunk, exception_on_overflow=False)
-                self.frames.append(data)
-            except IOError as e:
-                logger.error(f"Error reading from stream: {e}")
-                # Could indicate a device disconnection or other issue
-                self.stop_recording() # Stop recording if there's a stream error
+    def close(self):
+        """Release the PyAudio instance. Call once at application shutdown."""
+        if self.is_recording:
+            self.stop_recording()
+        if self.p:
+            self.p.terminate()
+            self.p = None
+            logger.info("PyAudio terminated.")
 
 if __name__ == '__main__':
     # Example Usage (Commented out for non-interactive environment)
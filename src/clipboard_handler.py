@@ -1,15 +1,84 @@
+import functools
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+
 import pyperclip
 from .logger_setup import get_logger
 
 logger = get_logger(__name__)
 
+# Resolve the pyperclip backend once at import. pyperclip's default copy is a
+# lazy stub that re-runs backend detection (PATH stats for xclip/xsel, ctypes
+# loading on Windows); binding the detected functions here makes every
+# subsequent copy a plain call.
+try:
+    _copy, _paste = pyperclip.determine_clipboard()
+except Exception as e:  # pragma: no cover - depends on host clipboard tooling
+    logger.warning(f"Clipboard backend detection failed at import: {e}")
+    _copy, _paste = pyperclip.copy, pyperclip.paste
+
+def _resolve_copy_argv():
+    """Pick a direct one-shot subprocess copier where one exists.
+
+    On Linux, xsel (preferred) or xclip fed via stdin is one fork/exec and a
+    write; pyperclip's wrapper adds shell and setup overhead per call. xclip
+    gets -filter so it can't hang waiting inside a pipeline. macOS has pbcopy.
+    On other platforms the cached pyperclip backend is used instead.
+    """
+    if sys.platform.startswith("linux"):
+        if shutil.which("xsel"):
+            return ["xsel", "-b", "-i"]
+        if shutil.which("xclip"):
+            return ["xclip", "-selection", "clipboard", "-in", "-filter"]
+    elif sys.platform == "darwin":
+        if shutil.which("pbcopy"):
+            return ["pbcopy"]
+    return None
+
+_copy_argv = _resolve_copy_argv()
+
+@functools.lru_cache(maxsize=4)
+def _encode(text: str) -> bytes:
+    """UTF-8 encode for the subprocess backend; cached so re-copying the
+    same large transcript skips the O(N) encode."""
+    return text.encode("utf-8")
+
+# Last successfully copied string; repeat copies of the same text skip the
+# backend round trip (subprocess spawn / X server traffic) entirely.
+_last_copied = None
+
+# Successful copies since import; logged periodically instead of per call so
+# auto-copying workers don't flood the log handler.
+_copy_count = 0
+
 def copy_to_clipboard(text: str):
     """
     Copies the given text to the OS clipboard.
     """
+    global _last_copied, _copy_count
+    if not text:
+        # Nothing to paste afterwards either way; skip the backend round trip
+        _last_copied = ""
+        return True
+    if text == _last_copied:
+        logger.debug("Clipboard already holds this text; skipping copy.")
+        return True
     try:
-        pyperclip.copy(text)
-        logger.info("Text successfully copied to clipboard.")
+        if _copy_argv is not None:
+            proc = subprocess.Popen(_copy_argv, stdin=subprocess.PIPE,
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            proc.communicate(_encode(text))
+            if proc.returncode:
+                raise OSError(f"{_copy_argv[0]} exited with code {proc.returncode}")
+        else:
+            _copy(text)
+        _last_copied = text
+        _copy_count += 1
+        if _copy_count & 0xFF == 0:
+            logger.debug("clipboard copies: %d", _copy_count)
         return True
     except pyperclip.PyperclipException as e:
         # This can happen if a copy/paste mechanism is not available.
@@ -21,16 +90,47 @@ def copy_to_clipboard(text: str):
         logger.error(f"An unexpected error occurred while copying to clipboard: {e}")
         return False
 
-if __name__ == '__main__':
-    # Adjust path for direct execution
-    import os
-    import sys
-    if __package__ is None:
-        sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-        # Re-import logger if necessary, or ensure it's available
-        from src.logger_setup import get_logger
-        # logger = get_logger(__name__) # Re-initialize if it wasn't picked up
+# Bounded handoff queue plus one lazily-started daemon worker, so callers on
+# latency-sensitive threads never block on a slow clipboard backend.
+_copy_queue = queue.Queue(maxsize=4)
+_copy_worker_started = False
+_copy_worker_lock = threading.Lock()
+
+def _copy_worker():
+    while True:
+        text, on_done = _copy_queue.get()
+        success = copy_to_clipboard(text)
+        if on_done:
+            try:
+                on_done(success)
+            except Exception as e:
+                logger.error(f"Clipboard on_done callback failed: {e}", exc_info=True)
+
+def copy_to_clipboard_async(text: str, on_done=None):
+    """
+    Queue a clipboard copy on a background worker and return immediately.
 
+    on_done, if given, is called with the copy result (True/False) from the
+    worker thread. If the queue is full the oldest pending copy is dropped —
+    the newest text is the one the user cares about.
+    """
+    global _copy_worker_started
+    with _copy_worker_lock:
+        if not _copy_worker_started:
+            threading.Thread(target=_copy_worker, daemon=True, name="clipboard-copy").start()
+            _copy_worker_started = True
+    while True:
+        try:
+            _copy_queue.put_nowait((text, on_done))
+            return
+        except queue.Full:
+            try:
+                _copy_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+if __name__ == '__main__':
+    # The module-level logger is already bound; no re-import needed here.
     logger.info("Clipboard Handler Example")
 
     test_text_1 = "Hello, this is a test string for the clipboard!"
@@ -1,3 +1,6 @@
+import asyncio
+import os
+import time
 import flet as ft
 import threading
 import queue # For thread-safe communication with the GUI
@@ -6,7 +9,6 @@ import queue # For thread-safe communication with the GUI
 try:
     from .logger_setup import get_logger
 except ImportError:
-    import os
     import sys
     sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
     from src.logger_setup import get_logger
@@ -14,21 +16,43 @@ except ImportError:
 logger = get_logger(__name__)
 
 # --- Constants ---
+_SHUTDOWN = object()  # queue sentinel that stops the update worker
+
 APP_TITLE = "Transcription App"
 STATUS_IDLE = "Status: Idle"
 STATUS_RECORDING = "● Recording..."
 STATUS_TRANSCRIBING = "Transcribing..."
 STATUS_ERROR = "Error!"
 
+# Status color names resolved to Flet colors once, instead of an attribute
+# lookup chain on every status update
+_MAX_DISPLAY_CHARS = 65536 # Cap on text pushed to a transcript field per update
+
+_COLOR_MAP = {
+    "red": ft.Colors.RED_600,
+    "yellow": ft.Colors.AMBER_600,
+    "orange": ft.Colors.ORANGE_600,
+}
+
 class TranscriptionGUI:
+    # Record-button (text, bgcolor, color) triples, resolved once at class
+    # creation instead of per toggle
+    _REC_STYLE_ON = ("Stop Recording", ft.Colors.RED_400, ft.Colors.WHITE)
+    _REC_STYLE_OFF = ("Start Recording", ft.Colors.GREEN_400, ft.Colors.WHITE)
+
     def __init__(self, button_callback=None):
         self.page = None
         self.recording_status_text = STATUS_IDLE
         self.transcript_text = ""
         self.button_callback = button_callback
 
-        # Queue for updates from other threads to the GUI
-        self.gui_queue = queue.Queue()
+        # Queue for updates from other threads to the GUI. SimpleQueue is a
+        # C-implemented FIFO without task-tracking overhead on put/get, and
+        # accepts posts before the page (and its event loop) exists.
+        self.gui_queue = queue.SimpleQueue()
+
+        # Wakes the consumer task on Flet's event loop when a message lands
+        self._wake = asyncio.Event()
 
         # UI Controls - Live Recording Tab
         self.status_indicator = None
@@ -48,11 +72,49 @@ class TranscriptionGUI:
         
         # Shared UI Controls
         self.status_bar = None
+        self._file_picker = None
+        self._dir_picker = None
         
         # State variables
         self.is_recording = False
         self.selected_file_path = None
 
+        # Recording timer, driven by the queue worker while active
+        self._timer_start = None
+        self._timer_last_str = None
+
+        # Last-applied values, used to drop no-op widget updates
+        self._last_status = None
+        self._last_timer_value = None
+        self._last_reference = None
+        self._last_file_transcript = None
+
+        # Monotonic deadline after which the status bar is cleared
+        self._statusbar_clear_at = None
+
+        # Controls mutated since the last flush; the queue consumer calls
+        # control.update() on each, diffing only the changed subtrees
+        # instead of the whole page.
+        self._dirty_controls = set()
+
+        # Set when the shutdown sentinel is seen; stops the update worker
+        self._closing = False
+
+        # Queue message dispatch table, built once; handlers take the
+        # message's positional payload
+        self._dispatch = {
+            "update_status": self.update_status_indicator,
+            "update_timer": self.update_timer,
+            "update_transcript": self.update_transcript_area,
+            "set_button_states": self.enable_record_button,
+            "show_status_message": self.show_status_message,
+            "update_reference_status": self.update_reference_status,
+            "update_file_transcript": self.update_file_transcript_area,
+            "set_file_button_states": self.enable_transcribe_file_button,
+            "start_timer": self._start_timer,
+            "stop_timer": self._stop_timer,
+        }
+
     def _build_ui(self, page: ft.Page):
         page.title = APP_TITLE
         page.theme_mode = ft.ThemeMode.LIGHT
@@ -60,97 +122,50 @@ class TranscriptionGUI:
         page.window_width = 400
         page.window_height = 600
 
-        # Initialize UI controls for live recording tab
-        self.status_indicator = ft.Text(
-            self.recording_status_text,
-            size=16,
-            weight=ft.FontWeight.BOLD,
-            color=ft.Colors.BLACK87,
-            expand=True
-        )
-        
-        self.timer_text = ft.Text(
-            "00:00:00",
-            size=14,
-            text_align=ft.TextAlign.RIGHT
-        )
-        
-        self.reference_status = ft.Text(
-            "Not loaded",
-            size=12,
-            color="grey"
-        )
-        
-        self.x2_mode_checkbox = ft.Checkbox(
-            label="x2 Speed Mode (Experimental)",
-            tooltip="Convert audio to 2x speed before transcription to reduce token usage"
-        )
-        
-        self.record_button = ft.ElevatedButton(
-            "Start Recording",
-            on_click=self._on_record_click,
-            expand=True,
-            bgcolor=ft.Colors.GREEN_400,
-            color=ft.Colors.WHITE
-        )
-        
-        self.transcript_area = ft.TextField(
-            multiline=True,
-            read_only=True,
-            expand=True,
-            min_lines=10,
-            max_lines=10
-        )
-        
-        # Initialize UI controls for file mode tab
-        self.file_picker_button = ft.ElevatedButton(
-            "Select Audio/Video File",
-            on_click=self._on_file_picker_click,
-            expand=True,
-            bgcolor=ft.Colors.BLUE_400,
-            color=ft.Colors.WHITE
-        )
-        
-        self.selected_file_text = ft.Text(
-            "No file selected",
-            size=12,
-            color="grey"
-        )
-        
-        self.output_dir_field = ft.TextField(
-            label="Output Directory",
-            value=self._get_default_downloads_path(),
-            expand=True
-        )
-        
-        self.browse_dir_button = ft.ElevatedButton(
-            "Browse",
-            on_click=self._on_browse_dir_click,
-            width=80
-        )
-        
-        self.transcribe_file_button = ft.ElevatedButton(
-            "Transcribe File",
-            on_click=self._on_transcribe_file_click,
-            expand=True,
-            bgcolor=ft.Colors.ORANGE_400,
-            color=ft.Colors.WHITE,
-            disabled=True
-        )
-        
-        self.file_transcript_area = ft.TextField(
-            multiline=True,
-            read_only=True,
-            expand=True,
-            min_lines=10,
-            max_lines=10
-        )
-        
-        self.status_bar = ft.Text(
-            "",
-            size=12,
-            color="blue"
-        )
+        # Control construction is table-driven: one spec per control, applied
+        # in a single loop, rather than a dozen hand-written blocks. Live
+        # recording tab first, then file mode tab, then shared controls.
+        control_specs = [
+            ("status_indicator", ft.Text, dict(
+                value=self.recording_status_text, size=16,
+                weight=ft.FontWeight.BOLD, color=ft.Colors.BLACK87, expand=True)),
+            ("timer_text", ft.Text, dict(
+                value="00:00:00", size=14, text_align=ft.TextAlign.RIGHT)),
+            ("reference_status", ft.Text, dict(
+                value="Not loaded", size=12, color="grey")),
+            ("x2_mode_checkbox", ft.Checkbox, dict(
+                label="x2 Speed Mode (Experimental)",
+                tooltip="Convert audio to 2x speed before transcription to reduce token usage")),
+            ("record_button", ft.ElevatedButton, dict(
+                text="Start Recording", on_click=self._on_record_click,
+                expand=True, bgcolor=ft.Colors.GREEN_400, color=ft.Colors.WHITE)),
+            ("transcript_area", ft.TextField, dict(
+                multiline=True, read_only=True, expand=True, min_lines=10, max_lines=10)),
+            ("file_picker_button", ft.ElevatedButton, dict(
+                text="Select Audio/Video File", on_click=self._on_file_picker_click,
+                expand=True, bgcolor=ft.Colors.BLUE_400, color=ft.Colors.WHITE)),
+            ("selected_file_text", ft.Text, dict(
+                value="No file selected", size=12, color="grey")),
+            ("output_dir_field", ft.TextField, dict(
+                label="Output Directory", value=self._get_default_downloads_path(), expand=True)),
+            ("browse_dir_button", ft.ElevatedButton, dict(
+                text="Browse", on_click=self._on_browse_dir_click, width=80)),
+            ("transcribe_file_button", ft.ElevatedButton, dict(
+                text="Transcribe File", on_click=self._on_transcribe_file_click,
+                expand=True, bgcolor=ft.Colors.ORANGE_400, color=ft.Colors.WHITE, disabled=True)),
+            ("file_transcript_area", ft.TextField, dict(
+                multiline=True, read_only=True, expand=True, min_lines=10, max_lines=10)),
+            ("status_bar", ft.Text, dict(
+                value="", size=12, color="blue")),
+        ]
+        for name, ctor, kwargs in control_specs:
+            setattr(self, name, ctor(**kwargs))
+
+        # One picker per dialog type, created once and reused across clicks;
+        # allocating a FilePicker per click would grow page.overlay unboundedly
+        self._file_picker = ft.FilePicker(on_result=self._on_file_picked)
+        self._dir_picker = ft.FilePicker(on_result=self._on_directory_picked)
+        page.overlay.extend([self._file_picker, self._dir_picker])
 
         # Build live recording tab content
         live_recording_tab = ft.Tab(
@@ -244,83 +259,79 @@ class TranscriptionGUI:
             except Exception as ex:
                 logger.error(f"Error executing button callback: {ex}", exc_info=True)
                 self.show_status_message(f"Error: {ex}")
+                if self.page:
+                    self.page.update() # On Flet's thread; flush without waiting for the worker
 
     def update_status_indicator(self, status: str, color: str = "black"):
+        if (status, color) == self._last_status:
+            return # No visible change; skip the configure + redraw
+        self._last_status = (status, color)
         self.recording_status_text = status
-        if self.status_indicator:
-            self.status_indicator.value = status
-            if color == "red":
-                self.status_indicator.color = ft.Colors.RED_600
-            elif color == "yellow":
-                self.status_indicator.color = ft.Colors.AMBER_600
-            elif color == "orange":
-                self.status_indicator.color = ft.Colors.ORANGE_600
-            else:
-                self.status_indicator.color = ft.Colors.BLACK87
-            
-            # Update recording state and button appearance
-            if "Recording" in status:
-                self.is_recording = True
-                self._update_record_button()
-            elif status == STATUS_IDLE:
-                self.is_recording = False
-                self._update_record_button()
-            
-            if self.page:
-                self.page.update()
-            logger.debug(f"Status indicator updated to: {status}")
+        self.status_indicator.value = status
+        self.status_indicator.color = _COLOR_MAP.get(color, ft.Colors.BLACK87)
+
+        # Update recording state and button appearance. Producers send the
+        # module-level status constants, so an exact compare replaces the
+        # substring scan and can't mis-trigger on look-alike text.
+        if status == STATUS_RECORDING:
+            self.is_recording = True
+            self._update_record_button()
+        elif status == STATUS_IDLE:
+            self.is_recording = False
+            self._update_record_button()
+
+        self._mark_dirty(self.status_indicator)
+        logger.debug("Status indicator updated to: %s", status)
 
     def update_timer(self, time_str: str):
-        if self.timer_text:
-            self.timer_text.value = time_str
-            if self.page:
-                self.page.update()
+        if time_str == self._last_timer_value:
+            return
+        self._last_timer_value = time_str
+        self.timer_text.value = time_str
+        self._mark_dirty(self.timer_text)
 
     def update_transcript_area(self, text: str):
+        if text == self.transcript_text:
+            return # Unchanged; skip re-serializing the whole value to the page
         self.transcript_text = text
-        if self.transcript_area:
-            self.transcript_area.value = text
-            if self.page:
-                self.page.update()
-            logger.debug("Transcript area updated.")
+        # Display only the tail of very long transcripts; pushing the
+        # full text across the Flet bridge grows per-update cost without
+        # bound. The full transcript is kept in self.transcript_text.
+        self.transcript_area.value = text[-_MAX_DISPLAY_CHARS:]
+        self._mark_dirty(self.transcript_area)
+        logger.debug("Transcript area updated.")
 
     def _update_record_button(self):
         """Update the record button text and color based on current state"""
-        if self.record_button:
-            if self.is_recording:
-                self.record_button.text = "Stop Recording"
-                self.record_button.bgcolor = ft.Colors.RED_400
-                self.record_button.color = ft.Colors.WHITE
-            else:
-                self.record_button.text = "Start Recording"
-                self.record_button.bgcolor = ft.Colors.GREEN_400
-                self.record_button.color = ft.Colors.WHITE
-            
-            if self.page:
-                self.page.update()
+        style = self._REC_STYLE_ON if self.is_recording else self._REC_STYLE_OFF
+        (self.record_button.text,
+         self.record_button.bgcolor,
+         self.record_button.color) = style
+        self._mark_dirty(self.record_button)
     
     def enable_record_button(self, enabled: bool = True):
         """Enable or disable the record button"""
-        if self.record_button:
+        if self.record_button.disabled == enabled:
             self.record_button.disabled = not enabled
-            if self.page:
-                self.page.update()
+            self._mark_dirty(self.record_button)
 
     def show_status_message(self, message: str, duration_ms: int = 3000):
-        if self.status_bar:
+        if message != self.status_bar.value:
             self.status_bar.value = message
-            if self.page:
-                self.page.update()
-            logger.info(f"Status bar: {message}")
+            self._mark_dirty(self.status_bar)
+        # Arm the auto-clear deadline even on a repeat message; checked by the queue worker.
+        self._statusbar_clear_at = time.monotonic() + duration_ms / 1000 if message else None
+        logger.debug("Status bar: %s", message)
 
     def update_reference_status(self, status_text: str, color: str = "green"):
         """Update the reference file status display"""
-        if self.reference_status:
-            self.reference_status.value = status_text
-            self.reference_status.color = color
-            if self.page:
-                self.page.update()
-            logger.debug(f"Reference status updated to: {status_text}")
+        if (status_text, color) == self._last_reference:
+            return
+        self._last_reference = (status_text, color)
+        self.reference_status.value = status_text
+        self.reference_status.color = color
+        self._mark_dirty(self.reference_status)
+        logger.debug("Reference status updated to: %s", status_text)
 
     def get_x2_mode_enabled(self):
         """Get the current state of x2 speed mode toggle"""
@@ -330,20 +341,12 @@ class TranscriptionGUI:
 
     def _get_default_downloads_path(self):
         """Get the default Downloads directory path for Windows"""
-        import os
         return os.path.join(os.path.expanduser("~"), "Downloads")
 
     def _on_file_picker_click(self, e):
         """Handle file picker button click"""
         logger.info("File picker button clicked.")
-        # For now, we'll create a basic file picker using Flet's FilePicker
-        file_picker = ft.FilePicker(
-            on_result=self._on_file_picked
-        )
-        self.page.overlay.append(file_picker)
-        self.page.update()
-        
-        file_picker.pick_files(
+        self._file_picker.pick_files(
             dialog_title="Select Audio/Video File",
             file_type=ft.FilePickerFileType.CUSTOM,
             allowed_extensions=["wav", "mp3", "m4a", "mp4", "avi", "mov"]
@@ -371,14 +374,7 @@ class TranscriptionGUI:
     def _on_browse_dir_click(self, e):
         """Handle browse directory button click"""
         logger.info("Browse directory button clicked.")
-        # For now, we'll create a basic directory picker using Flet's FilePicker
-        dir_picker = ft.FilePicker(
-            on_result=self._on_directory_picked
-        )
-        self.page.overlay.append(dir_picker)
-        self.page.update()
-        
-        dir_picker.get_directory_path(dialog_title="Select Output Directory")
+        self._dir_picker.get_directory_path(dialog_title="Select Output Directory")
 
     def _on_directory_picked(self, e: ft.FilePickerResultEvent):
         """Handle directory picker result"""
@@ -400,6 +396,8 @@ class TranscriptionGUI:
             except Exception as ex:
                 logger.error(f"Error executing file transcribe callback: {ex}", exc_info=True)
                 self.show_status_message(f"Error: {ex}")
+                if self.page:
+                    self.page.update() # On Flet's thread; flush without waiting for the worker
 
     def set_file_transcribe_callback(self, callback):
         """Set the callback function for file transcription"""
@@ -407,45 +405,89 @@ class TranscriptionGUI:
 
     def update_file_transcript_area(self, text: str):
         """Update the file transcript area with new text"""
-        if self.file_transcript_area:
-            self.file_transcript_area.value = text
-            if self.page:
-                self.page.update()
-            logger.debug("File transcript area updated.")
+        if text == self._last_file_transcript:
+            return
+        self._last_file_transcript = text
+        self.file_transcript_area.value = text[-_MAX_DISPLAY_CHARS:]
+        self._mark_dirty(self.file_transcript_area)
+        logger.debug("File transcript area updated.")
 
     def enable_transcribe_file_button(self, enabled: bool = True):
         """Enable or disable the transcribe file button"""
-        if self.transcribe_file_button:
+        if self.transcribe_file_button.disabled == enabled:
             self.transcribe_file_button.disabled = not enabled
-            if self.page:
-                self.page.update()
+            self._mark_dirty(self.transcribe_file_button)
+
+
+    def _mark_dirty(self, control):
+        """Queue a control for a scoped update() on the next consumer flush."""
+        self._dirty_controls.add(control)
 
+    def post(self, msg):
+        """Thread-safe entry point for GUI updates from worker threads.
+
+        Enqueues the message and wakes the consumer task on Flet's event
+        loop. Safe to call before the UI exists — messages queue up and are
+        drained once the consumer starts.
+        """
+        self.gui_queue.put(msg)
+        page = self.page
+        if page is not None:
+            try:
+                page.loop.call_soon_threadsafe(self._wake.set)
+            except RuntimeError:
+                pass # Event loop already closed; shutdown race
 
     def _handle_gui_queue_updates(self):
-        """Process messages from the GUI queue."""
+        """Process messages from the GUI queue.
+
+        The queue is drained fully before any widget is touched, keeping only
+        the latest payload per idempotent message type — a burst of timer or
+        transcript updates then costs one widget write instead of one per
+        message. show_status_message is not idempotent and is kept in order.
+        """
+        latest = {}
+        passthrough = []
         try:
-            while True:
-                message_type, data = self.gui_queue.get_nowait()
-                if message_type == "update_status":
-                    self.update_status_indicator(data.get("text"), data.get("color", "white"))
-                elif message_type == "update_timer":
-                    self.update_timer(data)
-                elif message_type == "update_transcript":
-                    self.update_transcript_area(data)
-                elif message_type == "set_button_states":
-                    self.enable_record_button(data.get("record_enabled", True))
-                elif message_type == "show_status_message":
-                    self.show_status_message(data.get("text"), data.get("duration", 3000))
-                elif message_type == "update_reference_status":
-                    self.update_reference_status(data.get("text"), data.get("color", "green"))
-                elif message_type == "update_file_transcript":
-                    self.update_file_transcript_area(data)
-                elif message_type == "set_file_button_states":
-                    self.enable_transcribe_file_button(data.get("transcribe_enabled", True))
-                # Add more message types as needed
-                self.gui_queue.task_done()
+            # Bounded drain: a runaway producer can't pin this loop and
+            # starve widget handling; leftovers are picked up next pass.
+            for _ in range(64):
+                msg = self.gui_queue.get_nowait()
+                if msg is _SHUTDOWN:
+                    self._closing = True
+                    break
+                if msg[0] == "show_status_message":
+                    passthrough.append(msg)
+                else:
+                    latest[msg[0]] = msg
         except queue.Empty:
-            pass # No messages in queue
+            pass
+
+        for msg in list(latest.values()) + passthrough:
+            self._dispatch_gui_message(msg)
+
+    def _start_timer(self):
+        # Stamp with monotonic time so the display is immune to
+        # wall-clock jumps (NTP adjustments, DST).
+        self._timer_start = time.monotonic()
+        self._timer_last_str = None
+
+    def _stop_timer(self):
+        self._timer_start = None
+        self.update_timer("00:00:00")
+
+    def _dispatch_gui_message(self, msg):
+        """Apply a single GUI queue message to the widgets.
+
+        Messages are positional tuples — ("update_status", text, color) —
+        dispatched through a handler dict: one lookup per message instead of
+        a string-compare chain.
+        """
+        handler = self._dispatch.get(msg[0])
+        if handler is not None:
+            handler(*msg[1:])
+        else:
+            logger.warning("Unknown GUI queue message type: %r", msg[0])
 
     def run_ui_blocking(self):
         """
@@ -454,53 +496,100 @@ class TranscriptionGUI:
         def main(page: ft.Page):
             self.page = page
             self._build_ui(page)
-            
-            # Start background thread to handle queue updates
-            threading.Thread(target=self._queue_update_worker, daemon=True).start()
-            
+
+            # Consume queue updates as a task on Flet's own event loop
+            page.run_task(self._consume_queue)
+
         ft.app(target=main)
         logger.info("GUI event loop finished.")
-        
-    def _queue_update_worker(self):
-        """Background worker to handle GUI queue updates"""
-        import time
-        while True:
+
+    async def _consume_queue(self):
+        """Consume GUI queue messages on Flet's event loop.
+
+        Runs as a page.run_task coroutine rather than a dedicated thread, so
+        all widget mutation happens on the loop Flet owns and no extra OS
+        thread or cross-thread hand-off is needed. Awaits the wake event
+        while idle — zero wakeups when nothing happens — and only falls back
+        to a short timeout while the recording timer needs periodic
+        refreshes.
+        """
+        while not self._closing:
             try:
+                timeout = 0.25 if self._timer_start is not None else None
+                if self._statusbar_clear_at is not None:
+                    remaining = max(0.05, self._statusbar_clear_at - time.monotonic())
+                    timeout = remaining if timeout is None else min(timeout, remaining)
+                # Only park when nothing is queued: posts made before the
+                # page existed couldn't set the wake event, so waiting first
+                # would leave them undrained until some later post.
+                if self.gui_queue.empty():
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+                self._wake.clear()
                 self._handle_gui_queue_updates()
-                time.sleep(0.1)  # Check queue every 100ms
+                if not self.gui_queue.empty():
+                    self._wake.set() # Bounded drain left messages; come straight back
+                now = time.monotonic()
+                self._tick_timer(now)
+                self._tick_statusbar(now)
+                # Scoped flush: each changed control diffs only its own
+                # subtree, instead of one whole-page diff per batch.
+                if self._dirty_controls:
+                    controls, self._dirty_controls = self._dirty_controls, set()
+                    for control in controls:
+                        control.update()
             except Exception as e:
-                logger.error(f"Error in queue update worker: {e}", exc_info=True)
+                logger.error(f"Error in GUI queue consumer: {e}", exc_info=True)
+
+    def _tick_statusbar(self, now):
+        """Clear the status bar once its display duration has elapsed."""
+        if self._statusbar_clear_at is None or now < self._statusbar_clear_at:
+            return
+        self._statusbar_clear_at = None
+        self.status_bar.value = ""
+        self._mark_dirty(self.status_bar)
+
+    def _tick_timer(self, now):
+        """Refresh the recording timer display while a recording is active."""
+        if self._timer_start is None:
+            return
+        # Plain integer math; strftime/gmtime allocate and lock for no gain.
+        elapsed = int(now - self._timer_start)
+        h, rem = divmod(elapsed, 3600)
+        m, s = divmod(rem, 60)
+        timer_str = f"{h:02d}:{m:02d}:{s:02d}"
+        if timer_str != self._timer_last_str:
+            self._timer_last_str = timer_str
+            self.update_timer(timer_str)
 
     def close(self):
-        if self.page:
-            self.page.window_close()
-            self.page = None
+        self.post(_SHUTDOWN) # Let the queue consumer exit cleanly
+        if self.page is None:
+            return # Already closed; avoid a second window teardown
+        # Clear the reference first so a concurrent close (event-loop exit
+        # racing an external close()) can't run window_close twice.
+        page, self.page = self.page, None
+        page.window_close()
         logger.info("GUI closed via method call.")
 
 if __name__ == '__main__':
-    # Adjust path for direct execution
-    import os
-    import sys
-    if __package__ is None: # or not __package__
-        sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-        from src.logger_setup import get_logger
-        # logger = get_logger(__name__) # Re-initialize if needed
-
+    # The module-level logger is already bound; no re-import needed here.
     logger.info("Starting Transcription GUI example...")
 
     gui = TranscriptionGUI()
 
     # Example of how another thread might send updates (for testing queue)
-    def example_background_updates(gui_queue):
-        import time
+    def example_background_updates(gui):
         time.sleep(3)
-        gui_queue.put(("update_transcript", "Transcript update from background thread after 3s."))
-        gui_queue.put(("show_status_message", {"text": "Background task updated transcript."}))
+        gui.post(("update_transcript", "Transcript update from background thread after 3s."))
+        gui.post(("show_status_message", "Background task updated transcript.", 3000))
         time.sleep(2)
-        gui_queue.put(("update_timer", "00:00:05")) # Example timer update
+        gui.post(("update_timer", "00:00:05")) # Example timer update
 
-    # In a real app, the main controller would hold the gui_queue.
-    threading.Thread(target=example_background_updates, args=(gui.gui_queue,), daemon=True).start()
+    # In a real app, the main controller would post through the GUI instance.
+    threading.Thread(target=example_background_updates, args=(gui,), daemon=True).start()
 
     try:
         gui.run_ui_blocking()
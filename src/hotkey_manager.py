@@ -1,26 +1,56 @@
 import keyboard
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from .logger_setup import get_logger
 
 logger = get_logger(__name__)
 
 class HotkeyManager:
+    # One callback running plus one queued behind it; further presses while
+    # both slots are taken are coalesced (dropped) instead of piling up.
+    _MAX_PENDING = 2
+
     def __init__(self, hotkey_str="ctrl+shift+r"):
         self.hotkey_str = hotkey_str
         self._callback = None
         self._is_running = False
         self._is_hooked = False # To track if keyboard.add_hotkey was successful
+        self._executor = None # Runs callbacks off the keyboard hook thread
+        self._stop_event = threading.Event() # Set when listening stops; unblocks wait_for_exit
+        self._pending = 0 # Submitted-but-unfinished callbacks, capped at _MAX_PENDING
+        self._pending_lock = threading.Lock()
 
     def _on_hotkey_pressed(self):
-        """Internal wrapper for the callback to log and execute."""
-        logger.info(f"Hotkey '{self.hotkey_str}' pressed.")
-        if self._callback:
-            try:
-                self._callback()
-            except Exception as e:
-                logger.error(f"Error executing hotkey callback: {e}", exc_info=True)
-        else:
+        """Internal wrapper for the callback to log and dispatch."""
+        # %-style args: no string interpolation happens if INFO is filtered
+        logger.info("Hotkey '%s' pressed.", self.hotkey_str)
+        if not self._callback:
             logger.warning("Hotkey pressed, but no callback is registered.")
+            return
+        if self._executor is None:
+            logger.warning("Hotkey pressed, but the listener is not running.")
+            return
+        # Back-pressure: a user mashing the hotkey during a slow callback
+        # would otherwise queue unbounded work on the executor.
+        with self._pending_lock:
+            if self._pending >= self._MAX_PENDING:
+                logger.info("Hotkey press coalesced; %d callbacks already pending.",
+                            self._pending)
+                return
+            self._pending += 1
+        # Hand off to the worker so the keyboard hook thread returns
+        # immediately; a slow callback (network, disk) can't stall the
+        # OS-level input hook and drop key events.
+        future = self._executor.submit(self._callback)
+        future.add_done_callback(self._log_callback_result)
+
+    def _log_callback_result(self, future):
+        with self._pending_lock:
+            self._pending -= 1
+        exc = future.exception()
+        if exc is not None:
+            logger.error(f"Error executing hotkey callback: {exc}", exc_info=exc)
 
     def register_callback(self, callback_func):
         """
@@ -46,11 +76,14 @@ class HotkeyManager:
             return False
 
         try:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hotkey")
             # keyboard.add_hotkey is non-blocking in the sense that it sets up the hook
             # and returns. The actual listening happens in a background thread managed by the library.
             keyboard.add_hotkey(self.hotkey_str, self._on_hotkey_pressed, suppress=False) # suppress=False allows the key event to pass through
             self._is_hooked = True
             self._is_running = True
+            self._stop_event.clear()
             logger.info(f"Hotkey listener started for '{self.hotkey_str}'. Press the hotkey to trigger.")
             return True
         except Exception as e:
@@ -79,7 +112,12 @@ class HotkeyManager:
             # This can occur if the hotkey was already removed or never properly set.
             logger.warning(f"Error trying to remove hotkey '{self.hotkey_str}': {e}. It might have already been cleared or not set up.")
 
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
         self._is_running = False
+        self._stop_event.set()
         logger.info("Hotkey listener stopped.")
 
     def wait_for_exit(self, exit_hotkey_str=None):
@@ -100,12 +138,12 @@ class HotkeyManager:
             self.stop_listening() # Stop the main hotkey listener as well
         else:
             # If no specific exit hotkey, just keep alive.
-            # This is a naive way; in a real app, the application's main loop handles this.
-            # For the `keyboard` library, once `add_hotkey` is called,
-            # its internal threads keep listening. This `wait` is more for a console app.
+            # The `keyboard` library's internal threads keep listening once
+            # `add_hotkey` is called; this wait is for console apps. The
+            # event parks the thread in the kernel with zero CPU until
+            # stop_listening() is called, instead of waking every 100 ms.
             try:
-                while self._is_running: # This loop might not be strictly necessary if keyboard lib handles its thread well
-                    time.sleep(0.1) # Keep the main thread alive if needed.
+                self._stop_event.wait()
             except KeyboardInterrupt:
                 logger.info("KeyboardInterrupt received. Stopping listener...")
             finally:
@@ -113,13 +151,7 @@ class HotkeyManager:
 
 
 if __name__ == '__main__':
-    import os
-    import sys
-    if __package__ is None:
-        sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-        from src.logger_setup import get_logger
-        # logger = get_logger(__name__) # Re-initialize if needed
-
+    # The module-level logger is already bound; no re-import needed here.
     logger.info("Hotkey Manager Example")
 
     # --- Test Callback Function ---
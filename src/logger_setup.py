@@ -1,28 +1,45 @@
+import atexit
+import functools
 import logging
-import os
-from logging.handlers import RotatingFileHandler
-
-# Define project root as one level up from the 'src' directory where this file is located
-PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-LOGS_DIR = os.path.join(PROJECT_ROOT, 'logs')
-
-# Create logs directory if it doesn't exist
-if not os.path.exists(LOGS_DIR):
-    os.makedirs(LOGS_DIR)
-    # print(f"Created logs directory: {LOGS_DIR}") # For debugging
-
-log_file_path = os.path.join(LOGS_DIR, 'transcription_app.log')
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(module)s - %(message)s',
-    handlers=[
-        RotatingFileHandler(log_file_path, maxBytes=1024*1024*5, backupCount=5), # 5 MB per file, 5 backup files
-        logging.StreamHandler() # Also log to console
-    ]
-)
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
 
+# Project root is one level up from the 'src' directory where this file
+# lives. mkdir with exist_ok is a single idempotent call — no racy
+# exists-then-create check.
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+LOGS_DIR = PROJECT_ROOT / 'logs'
+LOGS_DIR.mkdir(parents=True, exist_ok=True)
+
+log_file_path = LOGS_DIR / 'transcription_app.log'
+
+# Configure logging. Callers only enqueue records (microseconds); a
+# dedicated QueueListener thread does the formatting and the file/console
+# I/O, so logging on the hotkey or network path never blocks on disk.
+#
+# Guarded so a second import under a different module name (src.logger_setup
+# vs logger_setup in the __main__ blocks) can't install a second handler
+# pair and double every line written to disk.
+_root = logging.getLogger()
+if not any(isinstance(h, QueueHandler) for h in _root.handlers):
+    _log_queue = queue.SimpleQueue()
+
+    _formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(module)s - %(message)s')
+    _file_handler = RotatingFileHandler(log_file_path, maxBytes=1024*1024*5, backupCount=5) # 5 MB per file, 5 backup files
+    _stream_handler = logging.StreamHandler() # Also log to console
+    _file_handler.setFormatter(_formatter)
+    _stream_handler.setFormatter(_formatter)
+
+    _root.setLevel(logging.INFO)
+    _root.addHandler(QueueHandler(_log_queue))
+
+    _listener = QueueListener(_log_queue, _file_handler, _stream_handler,
+                              respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop) # Flush pending records at interpreter exit
+
+@functools.lru_cache(maxsize=None)
 def get_logger(name):
     return logging.getLogger(name)
 
@@ -1,19 +1,64 @@
+import functools
+import json
+import logging
+import mmap
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import yaml
+
+# libyaml-backed loader where available; several times faster than the
+# pure-Python SafeLoader and safe in the same sense.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError: # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# Optional: streams the multipart body from disk instead of buffering the
+# whole recording in memory before the first byte hits the wire.
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError: # pragma: no cover - depends on optional requests-toolbelt
+    MultipartEncoder = None
 from dotenv import load_dotenv
 from .logger_setup import get_logger
 from .audio_processor import AudioProcessor
 
 logger = get_logger(__name__)
 
+# Project root (one level above src/), resolved once at import
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Smallest WAV worth uploading: 44-byte RIFF header plus one 16-bit frame
+_MIN_WAV_BYTES = 46
+
 class OpenAITranscriber:
+    _config = None  # Memoized (api_key, model_name) so .env is parsed once per process
+
+    # (connect, read) timeout so a stuck socket can't hang a transcription
+    # thread forever; reads are generous because uploads can be large.
+    _REQUEST_TIMEOUT = (10, 300)
+
+    @classmethod
+    def check_config(cls):
+        """Load .env once and return (api_key, model_name).
+
+        Memoized on the class so the __main__ startup check and the
+        transcriber itself share a single .env parse.
+        """
+        if cls._config is None:
+            load_dotenv()
+            cls._config = (os.getenv("OPENAI_API_KEY"),
+                           os.getenv("MODEL_NAME", "gpt-4o-mini-transcribe"))
+        return cls._config
+
     def __init__(self):
-        load_dotenv()  # Load environment variables from .env
-        self.api_key = os.getenv("OPENAI_API_KEY")
-        self.model_name = os.getenv("MODEL_NAME", "gpt-4o-mini-transcribe") # Default to gpt-4o-mini-transcribe if not set
+        self.api_key, self.model_name = self.check_config()
 
-        if not self.api_key or self.api_key == "YOUR_OPENAI_API_KEY_HERE":
+        # Evaluated once; transcribe_audio checks this flag per call instead
+        # of re-comparing the key against the placeholder string.
+        self._key_ok = bool(self.api_key) and self.api_key != "YOUR_OPENAI_API_KEY_HERE"
+        if not self._key_ok:
             logger.error("OPENAI_API_KEY not found or not set in .env file. Please set it to use OpenAI transcription.")
             # Potentially raise an exception or handle this state in the app
             # For now, we'll allow initialization but transcription will fail.
@@ -21,28 +66,73 @@ class OpenAITranscriber:
         # The new audio transcriptions endpoint for gpt-4o is slightly different
         # It's recommended to use the /v1/audio/transcriptions endpoint
         self.api_url = "https://api.openai.com/v1/audio/transcriptions"
-        
+
+        # Persistent session: keep-alive and connection pooling amortize the
+        # TCP + TLS handshake across hotkey-triggered transcriptions.
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
         # Load reference YAML if it exists
         self.reference_context = self._load_reference_yaml()
-        
+
+        # reference.yml is immutable after init, so the derived prompt and
+        # status line are computed once here instead of per call.
+        self._cached_prompt = self._compute_reference_prompt()
+        self._cached_status = self._compute_reference_status()
+
         # Initialize audio processor for speed conversion
         self.audio_processor = AudioProcessor()
 
     def _load_reference_yaml(self):
-        """Load reference.yml from project root if it exists"""
-        reference_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "reference.yml")
-        if os.path.exists(reference_path):
-            try:
-                with open(reference_path, 'r', encoding='utf-8') as f:
-                    reference_data = yaml.safe_load(f)
-                    logger.info(f"Loaded reference context from {reference_path}")
-                    return reference_data
-            except Exception as e:
-                logger.warning(f"Failed to load reference.yml: {e}")
-        return None
+        """Load the reference context, preferring the pre-compiled JSON cache.
+
+        reference.compiled.json is produced by tools/compile_reference.py
+        (and refreshed here after a YAML parse); json.load is much faster
+        than a YAML parse at startup. The cache is only trusted when it is
+        at least as new as reference.yml.
+        """
+        reference_path = os.path.join(PROJECT_ROOT, "reference.yml")
+        compiled_path = os.path.join(PROJECT_ROOT, "reference.compiled.json")
+        try:
+            yaml_mtime = os.stat(reference_path).st_mtime
+        except OSError:
+            return None
+
+        try:
+            if os.stat(compiled_path).st_mtime >= yaml_mtime:
+                with open(compiled_path, 'r', encoding='utf-8') as f:
+                    reference_data = json.load(f)
+                logger.info(f"Loaded reference context from {compiled_path}")
+                return reference_data
+        except (OSError, ValueError):
+            pass # Missing, stale or corrupt cache; fall back to the YAML
+
+        try:
+            with open(reference_path, 'r', encoding='utf-8') as f:
+                reference_data = yaml.load(f, Loader=_YamlLoader)
+            logger.info(f"Loaded reference context from {reference_path}")
+        except Exception as e:
+            logger.warning(f"Failed to load reference.yml: {e}")
+            return None
+
+        # Best-effort cache refresh so the next startup takes the JSON path.
+        # TypeError/ValueError cover YAML content json can't serialize (e.g.
+        # unquoted dates become datetime.date); temp file + os.replace keeps
+        # a partial write from ever shadowing the YAML as a newer cache.
+        try:
+            tmp_path = compiled_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(reference_data, f)
+            os.replace(tmp_path, compiled_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not write reference cache: %s", e)
+        return reference_data
 
     def get_reference_status(self):
         """Get the status of reference.yml loading for UI display"""
+        return self._cached_status
+
+    def _compute_reference_status(self):
         if self.reference_context:
             terms_count = len(self.reference_context.get('terminology', {}))
             has_context = bool(self.reference_context.get('context'))
@@ -61,7 +151,10 @@ class OpenAITranscriber:
             return "Not loaded", "gray"
 
     def _build_prompt_with_reference(self):
-        """Build a prompt string with reference context if available"""
+        """Return the prompt string with reference context, if available"""
+        return self._cached_prompt
+
+    def _compute_reference_prompt(self):
         if not self.reference_context:
             return None
         
@@ -87,13 +180,21 @@ class OpenAITranscriber:
         return "\n".join(prompt_parts) if prompt_parts else None
 
     def transcribe_audio(self, audio_file_path, use_x2_speed=False):
-        if not self.api_key or self.api_key == "YOUR_OPENAI_API_KEY_HERE":
+        if not self._key_ok:
             logger.error("Cannot transcribe: OPENAI_API_KEY is not configured.")
             return None, "OPENAI_API_KEY not configured"
 
-        if not os.path.exists(audio_file_path):
+        # One stat covers both existence and size; an empty or truncated
+        # recording fails here instead of after a full HTTPS round trip.
+        try:
+            st = os.stat(audio_file_path)
+        except OSError:
             logger.error(f"Audio file not found: {audio_file_path}")
             return None, "Audio file not found"
+        if st.st_size < _MIN_WAV_BYTES:
+            logger.error("Audio file too short to transcribe (%d bytes): %s",
+                         st.st_size, audio_file_path)
+            return None, "Audio file is empty or too short"
 
         # Process audio for x2 speed if requested
         processing_file_path = audio_file_path
@@ -105,32 +206,68 @@ class OpenAITranscriber:
             temp_file_created = (processing_file_path != audio_file_path)
 
         headers = {
-            "Authorization": f"Bearer {self.api_key}"
+            "Authorization": f"Bearer {self.api_key}",
+            # Explicitly ask for a compressed JSON response so proxies that
+            # strip the default hint can't force identity transfer; requests
+            # decodes gzip/deflate transparently.
+            "Accept-Encoding": "gzip, deflate",
         }
 
-        files = {
-            "file": (os.path.basename(processing_file_path), open(processing_file_path, 'rb'), "audio/wav"),
-            "model": (None, self.model_name) # Correctly send model as part of multipart
-        }
-        
-        # Add prompt if reference context is available
         prompt = self._build_prompt_with_reference()
-        if prompt:
-            files["prompt"] = (None, prompt)
-            logger.debug(f"Using reference prompt: {prompt[:100]}...")
-
-        # Parameters for transcription (optional, but good to be aware of)
-        # data = {
-        #     "model": self.model_name,
-        #     # "language": "en", # Can be specified if needed
-        #     # "response_format": "json", # Default is json
-        #     # "temperature": 0, # For transcription, usually 0
-        # }
 
         try:
             speed_info = " (x2 speed)" if use_x2_speed else ""
-            logger.info(f"Sending {processing_file_path} to OpenAI for transcription using model {self.model_name}{speed_info}...")
-            response = requests.post(self.api_url, headers=headers, files=files) # Removed data=data, model is in files
+            # Lazy %-formatting: interpolation is skipped when the level is off
+            logger.info("Sending %s to OpenAI for transcription using model %s%s...",
+                        processing_file_path, self.model_name, speed_info)
+            if prompt and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Using reference prompt: %s...", prompt[:100])
+
+            # The with-block guarantees the file handle is closed even when
+            # the request raises before the body is consumed.
+            with open(processing_file_path, 'rb') as audio_file:
+                basename = os.path.basename(processing_file_path)
+                if MultipartEncoder is not None:
+                    # Streamed multipart: bytes go out as they are read, so
+                    # the recording is never buffered whole in memory. The
+                    # body must be the file object itself — toolbelt tracks
+                    # remaining bytes via its fileno-based FileWrapper, and an
+                    # mmap (constant len, no fileno) makes the encoder's
+                    # read loop spin forever once the audio is exhausted.
+                    fields = {"file": (basename, audio_file, "audio/wav"),
+                              "model": self.model_name}
+                    if prompt:
+                        fields["prompt"] = prompt
+                    encoder = MultipartEncoder(fields=fields)
+                    response = self._session.post(
+                        self.api_url,
+                        headers={**headers, "Content-Type": encoder.content_type},
+                        data=encoder,
+                        timeout=self._REQUEST_TIMEOUT,
+                    )
+                else:
+                    # Buffered fallback: requests reads the body eagerly, so
+                    # an mmap view is safe here and serves straight from the
+                    # page cache — one less user-space copy.
+                    body = audio_file
+                    mm = None
+                    try:
+                        mm = mmap.mmap(audio_file.fileno(), 0, access=mmap.ACCESS_READ)
+                        body = mm
+                    except (ValueError, OSError): # Zero-byte or unmappable file
+                        pass
+                    try:
+                        files = {
+                            "file": (basename, body, "audio/wav"),
+                            "model": (None, self.model_name) # Correctly send model as part of multipart
+                        }
+                        if prompt:
+                            files["prompt"] = (None, prompt)
+                        response = self._session.post(self.api_url, headers=headers, files=files,
+                                                      timeout=self._REQUEST_TIMEOUT)
+                    finally:
+                        if mm is not None:
+                            mm.close()
             response.raise_for_status()  # Raises an HTTPError for bad responses (4XX or 5XX)
 
             result = response.json()
@@ -140,7 +277,7 @@ class OpenAITranscriber:
                 logger.error(f"Transcription failed. API response did not contain 'text'. Response: {result}")
                 return None, f"Transcription failed (no text in response)"
 
-            logger.info(f"Transcription successful{speed_info}.")
+            logger.info("Transcription successful%s.", speed_info)
             return transcript, None  # transcript, error_message (None if no error)
 
         except requests.exceptions.RequestException as e:
@@ -157,21 +294,21 @@ class OpenAITranscriber:
             if temp_file_created:
                 self.audio_processor.cleanup_temp_file(processing_file_path)
 
+@functools.lru_cache(maxsize=1)
+def get_transcriber():
+    """Process-wide OpenAITranscriber, built lazily on first use.
+
+    Construction parses .env and reference.yml and opens an HTTP session;
+    going through here guarantees that happens exactly once, however many
+    call sites need a transcriber.
+    """
+    return OpenAITranscriber()
+
 if __name__ == '__main__':
     # This example assumes you have a .env file with your OPENAI_API_KEY
     # and a sample audio file.
 
-    # Adjust path for direct execution
-    if __package__ is None:
-        sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-        from src.logger_setup import get_logger # Re-import for this scope if needed, or ensure logger is global
-        # If audio_recorder is needed for a test file:
-        # from src.audio_recorder import AudioRecorder
-
-    # Ensure logger is available if it wasn't setup by the class's module-level import
-    # This is a bit tricky due to how __main__ interacts with module imports.
-    # For simplicity, we'll rely on the module-level logger.
-
+    # The module-level logger is already bound; no re-import needed here.
     logger.info("Starting OpenAITranscriber example.")
 
     # Create a dummy .env if it doesn't exist for basic testing (without a real key it will fail gracefully)
@@ -0,0 +1,45 @@
+"""Pre-compile reference.yml into reference.compiled.json.
+
+Run at build or pre-commit time so app startup can load the reference
+context with json.load instead of a YAML parse. The transcriber falls
+back to the YAML (and rewrites the cache) whenever the cache is missing
+or older than reference.yml, so running this is an optimization, not a
+requirement.
+"""
+import json
+import os
+import sys
+
+import yaml
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+YAML_PATH = os.path.join(PROJECT_ROOT, 'reference.yml')
+JSON_PATH = os.path.join(PROJECT_ROOT, 'reference.compiled.json')
+
+def main():
+    try:
+        yaml_mtime = os.stat(YAML_PATH).st_mtime
+    except OSError:
+        print(f"No {YAML_PATH}; nothing to compile.")
+        return 0
+
+    try:
+        if os.stat(JSON_PATH).st_mtime >= yaml_mtime:
+            print(f"{JSON_PATH} is up to date.")
+            return 0
+    except OSError:
+        pass
+
+    with open(YAML_PATH, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+    # Temp file + replace so an interrupted run can't leave a partial cache
+    # that looks newer than the YAML
+    tmp_path = JSON_PATH + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, JSON_PATH)
+    print(f"Wrote {JSON_PATH}.")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())